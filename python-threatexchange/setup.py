@@ -28,6 +28,9 @@ extras_require = {
     "ocr": [
         "pytesseract",
     ],
+    "fast_json": [
+        "orjson",
+    ],
 }
 
 all_extras = set(sum(extras_require.values(), []))
@@ -0,0 +1,84 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import time
+import unittest
+
+from threatexchange.threat_updates import ThreatUpdateJSON, ThreatUpdatesDelta
+
+
+class _FakeCursor:
+    """Stands in for api._CursoredResponse with canned pages"""
+
+    def __init__(self, pages):
+        self.pages = [list(page) for page in pages]
+        self.data = []
+
+    @property
+    def done(self):
+        return not self.pages
+
+    def next(self):
+        if self.done:
+            return []
+        self.data = self.pages.pop(0)
+        return self.data
+
+
+class _FakeThreatExchangeAPI:
+    def __init__(self, pages):
+        self.cursor = _FakeCursor(pages)
+
+    def get_threat_updates(self, *args, **kwargs):
+        return self.cursor
+
+
+def _make_pages(page_sizes):
+    serial = 0
+    pages = []
+    for size in page_sizes:
+        page = []
+        for _ in range(size):
+            serial += 1
+            page.append(
+                ThreatUpdateJSON(
+                    {"id": str(serial), "last_updated": str(1000 + serial)}
+                )
+            )
+        pages.append(page)
+    return pages
+
+
+class ThreatUpdatesDeltaSyncTest(unittest.TestCase):
+    def test_sync_processes_every_update(self):
+        """Every update reaches progress_fn, even on the final page.
+
+        The prefetch of the last page can complete while the previous page is
+        still being processed (guaranteed here by the slow progress_fn, since
+        the fake fetch is instant) - the sync loop must not consult shared
+        delta state that the background fetch has already advanced.
+        """
+        api = _FakeThreatExchangeAPI(_make_pages([2, 2, 2]))
+        delta = ThreatUpdatesDelta(123)
+        seen = []
+
+        def slow_progress(update):
+            time.sleep(0.01)
+            seen.append(update.id)
+
+        delta.incremental_sync_from_threatexchange(api, progress_fn=slow_progress)
+
+        self.assertTrue(delta.done)
+        self.assertEqual(seen, [1, 2, 3, 4, 5, 6])
+        self.assertEqual([u.id for u in delta.updates], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(delta.current, delta.end)
+
+    def test_sync_respects_limit(self):
+        api = _FakeThreatExchangeAPI(_make_pages([2, 2, 2]))
+        delta = ThreatUpdatesDelta(123)
+        seen = []
+
+        delta.incremental_sync_from_threatexchange(
+            api, limit=3, progress_fn=lambda u: seen.append(u.id)
+        )
+
+        self.assertEqual(seen, [1, 2, 3])
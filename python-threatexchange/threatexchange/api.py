@@ -20,6 +20,13 @@ from requests.packages.urllib3.util.retry import Retry
 
 from .api_representations import ThreatPrivacyGroup
 
+try:
+    # threat_updates responses can be very large, and orjson decodes them
+    # several times faster than the stdlib parser
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TimeoutHTTPAdapter(HTTPAdapter):
     """
@@ -75,6 +82,11 @@ class _CursoredResponse:
 class ThreatExchangeAPI:
     _TE_BASE_URL = "https://graph.facebook.com/v9.0"
 
+    # FetchCommand fans descriptor fetches out over a 100-worker thread pool;
+    # size the connection pool to match, or urllib3 falls back to its default
+    # of 10 pooled connections and discards the rest after every request
+    _CONNECTION_POOL_SIZE = 100
+
     # This is just a keystroke-saver / error-avoider for passing around
     # post-parameter field names.
 
@@ -109,6 +121,7 @@ class ThreatExchangeAPI:
     ) -> None:
         self.api_token = api_token
         self._base_url = endpoint_override or self._TE_BASE_URL
+        self._session: t.Optional[requests.Session] = None
 
     @property
     def app_id(self):
@@ -119,10 +132,39 @@ class ThreatExchangeAPI:
         Perform an HTTP GET request, and return the JSON response payload.
         Same timeouts and retry strategy as `_get_session` above.
         """
-        with self._get_session() as session:
-            response = requests.get(url, params=params or {})
-            response.raise_for_status()
-            return response.json(object_hook=json_obj_hook)
+        response = self._shared_session.get(url, params=params or {})
+        response.raise_for_status()
+        if json_obj_hook is None and orjson is not None:
+            return orjson.loads(response.content)
+        return response.json(object_hook=json_obj_hook)
+
+    @property
+    def _shared_session(self) -> requests.Session:
+        """
+        A session reused for the lifetime of this object (see close()).
+
+        Keeping one session means paged fetches reuse pooled keep-alive
+        connections instead of paying a fresh TCP+TLS handshake per request.
+        urllib3's connection pool is threadsafe; requests.Session makes no
+        such guarantee for its own state (cookie jar, redirect handling),
+        but the calls made here are stateless token-in-the-URL requests
+        that rely on neither.
+        """
+        if self._session is None:
+            self._session = self._get_session()
+        return self._session
+
+    def close(self) -> None:
+        """Release the shared session's pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "ThreatExchangeAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _get_session(self):
         """
@@ -142,6 +184,8 @@ class ThreatExchangeAPI:
             self._base_url,
             adapter=TimeoutHTTPAdapter(
                 timeout=60,
+                pool_connections=self._CONNECTION_POOL_SIZE,
+                pool_maxsize=self._CONNECTION_POOL_SIZE,
                 max_retries=Retry(
                     total=4,
                     status_forcelist=[429, 500, 502, 503, 504],
@@ -505,8 +549,7 @@ class ThreatExchangeAPI:
 
         # Do the POST
         try:
-            with self._get_session() as session:
-                return [None, None, session.post(url, data).json()]
+            return [None, None, self._shared_session.post(url, data).json()]
 
         except urllib.error.HTTPError as e:
             responseBody = json.loads(e.read().decode("utf-8"))
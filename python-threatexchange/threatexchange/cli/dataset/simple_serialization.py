@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
-import collections
 import csv
 import json
 import os
 import pathlib
+import sys
 import time
 import re
 import typing as t
@@ -19,6 +19,8 @@ from ...dataset import Dataset
 class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
     """A short compact serialization optimized for the CLI"""
 
+    __slots__ = ("indicator_type", "indicator", "rollup")
+
     def __init__(
         self, indicator_type: str, indicator: str, rollup: SimpleDescriptorRollup
     ):
@@ -37,7 +39,8 @@ class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
     @classmethod
     def from_threat_updates_json(cls, app_id, te_json):
         return cls(
-            te_json["type"],
+            # Interned - repeated for every indicator of the same type
+            sys.intern(te_json["type"]),
             te_json["indicator"],
             SimpleDescriptorRollup.from_threat_updates_json(app_id, te_json),
         )
@@ -51,16 +54,18 @@ class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
         cls, state_dir: pathlib.Path, contents: t.Iterable["CliIndicatorSerialization"]
     ) -> t.List[pathlib.Path]:
         # Stores in multiple files
-        row_by_type = collections.defaultdict(list)
+        # Buffer the plain row tuples rather than the wrapper objects - for
+        # large datasets this keeps one flat list per type instead of an
+        # object graph, and writerows can consume it directly
+        rows_by_type: t.Dict[str, t.List[t.Tuple]] = {}
         for item in contents:
-            row_by_type[item.indicator_type].append(item)
+            rows_by_type.setdefault(item.indicator_type, []).append(item.as_csv_row())
         ret = []
-        for threat_type, items in row_by_type.items():
+        for threat_type, rows in rows_by_type.items():
             path = state_dir / f"simple.{threat_type}{Dataset.EXTENSION}"
             ret.append(path)
             with path.open("w") as f:
-                writer = csv.writer(f)
-                writer.writerows(item.as_csv_row() for item in items)
+                csv.writer(f).writerows(rows)
         return ret
 
     @classmethod
@@ -74,7 +79,7 @@ class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
             match = re.match(pattern, path.name)
             if not match or not path.is_file():
                 continue
-            indicator_type = match.group(1)
+            indicator_type = sys.intern(match.group(1))
             # Violate your warranty with class state! Not threadsafe!
             csv.field_size_limit(path.stat().st_size)  # dodge field size problems
             with path.open("r", newline="") as f:
@@ -220,6 +220,9 @@ class FetchCommand(command_base.Command):
             # TODO - Write a checkpoint file on descriptors, potentially resume from that file
             #        if we exit
 
+            # Flattened once here - consume_descriptors iterates this per descriptor
+            signal_types = tuple(self.signal_types_by_name.items())
+
             def consume_descriptors(dq: collections.deque) -> int:
                 """Process descriptors in order"""
                 item = dq.popleft()
@@ -227,7 +230,7 @@ class FetchCommand(command_base.Command):
                 descriptors = item.result()
                 for descriptor in descriptors:
                     any_match = False
-                    for signal_name, signal_type in self.signal_types_by_name.items():
+                    for signal_name, signal_type in signal_types:
                         is_match = False
                         try:
                             is_match = signal_type.process_descriptor(descriptor)
@@ -98,8 +98,10 @@ class HashCommand(command_base.Command):
             if self.signal_type in (None, s.get_name())
         ]
 
-        file_hashers = [s for s in all_signal_types if issubclass(s, FileHasher)]
-        str_hashers = [s for s in all_signal_types if issubclass(s, StrHasher)]
+        can_file_hash = meta.get_signal_types_supporting(FileHasher)
+        can_str_hash = meta.get_signal_types_supporting(StrHasher)
+        file_hashers = [s for s in all_signal_types if s in can_file_hash]
+        str_hashers = [s for s in all_signal_types if s in can_str_hash]
 
         for inp in self.input_generator:
             hash_fn = lambda s, t: s.hash_from_file(t)
@@ -28,3 +28,15 @@ def get_all_signal_types() -> t.Set[t.Type[signal_base.SignalType]]:
 @functools.lru_cache(1)
 def get_signal_types_by_name() -> t.Dict[str, signal_base.SignalType]:
     return {s.get_name(): s for s in get_all_signal_types()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_signal_types_supporting(
+    capability: type,
+) -> t.FrozenSet[t.Type[signal_base.SignalType]]:
+    """
+    Returns signal_types implementing a capability mixin (e.g. FileHasher)
+
+    Cached so the issubclass() walk happens once per capability per process.
+    """
+    return frozenset(s for s in get_all_signal_types() if issubclass(s, capability))
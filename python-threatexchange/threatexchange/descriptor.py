@@ -6,6 +6,7 @@ Wrappers for the json returned by the ThreatExchange API to typed objects.
 """
 
 import collections
+import sys
 import typing as t
 
 
@@ -56,19 +57,30 @@ class ThreatDescriptor(t.NamedTuple):
     def from_te_json(cls, my_app_id: int, td_json) -> "ThreatDescriptor":
         # Hack for now, but nearly refactored out of cls state
         cls.MY_APP_ID = my_app_id
-        owner_id_str = td_json["owner"]["id"]
+        # This runs once per descriptor of every fetched indicator, so hoist
+        # the repeated class/dict lookups out of the per-tag work
+        special_tags = cls.SPECIAL_TAGS
+        # status/type/tag strings repeat across virtually every descriptor;
+        # interning shares their storage and makes later comparisons and
+        # dict/set probes hit the pointer-equality fast path
+        status = sys.intern(td_json["status"])
         tags = td_json.get("tags", [])
         # This is needed because ThreatExchangeAPI.get_threat_descriptors()
         # does a transform, but other locations do not
         if isinstance(tags, dict):
             tags = sorted(tag["text"] for tag in tags["data"])
+        if special_tags.isdisjoint(tags):
+            # Common case - nothing to strip, so skip the per-tag filtering
+            tags = [sys.intern(tag) for tag in tags]
+        else:
+            tags = [sys.intern(tag) for tag in tags if tag not in special_tags]
         td = cls(
             id=int(td_json["id"]),
             raw_indicator=td_json["raw_indicator"],
-            indicator_type=td_json["type"],
-            owner_id=int(owner_id_str),
-            tags=[tag for tag in tags if tag not in ThreatDescriptor.SPECIAL_TAGS],
-            status=td_json["status"],
+            indicator_type=sys.intern(td_json["type"]),
+            owner_id=int(td_json["owner"]["id"]),
+            tags=tags,
+            status=status,
             added_on=td_json["added_on"],
         )
         # Add special tags
@@ -76,20 +88,18 @@ class ThreatDescriptor(t.NamedTuple):
         #        from FALSE_POSITIVE & NON_MALICIOUS
         # Is this my descriptor?
         if td.is_mine:
-            if td.status == "NON_MALICIOUS":
-                td.tags.append(ThreatDescriptor.FALSE_POSITIVE)
+            if status == "NON_MALICIOUS":
+                td.tags.append(cls.FALSE_POSITIVE)
             else:
-                td.tags.append(ThreatDescriptor.TRUE_POSITIVE)
+                td.tags.append(cls.TRUE_POSITIVE)
         # Disputed path #1 - mark as non_malicious
-        elif td.status == "NON_MALICIOUS":
-            td.tags.append(ThreatDescriptor.DISPUTED)
+        elif status == "NON_MALICIOUS":
+            td.tags.append(cls.DISPUTED)
         # Disputed path #2 - react with DISAGREE_WITH_TAGS
         elif "DISAGREE_WITH_TAGS" in td_json.get("my_reactions", ()):
-            td.tags.append(ThreatDescriptor.FALSE_POSITIVE)
-        elif any(
-            t == "DISAGREE_WITH_TAGS" for r in td_json.get("reactions", []) for t in r
-        ):
-            td.tags.append(ThreatDescriptor.DISPUTED)
+            td.tags.append(cls.FALSE_POSITIVE)
+        elif any("DISAGREE_WITH_TAGS" in r for r in td_json.get("reactions", [])):
+            td.tags.append(cls.DISPUTED)
         return td
 
     def to_params(self) -> t.Dict[str, t.Any]:
@@ -155,7 +165,7 @@ class SimpleDescriptorRollup:
         if descriptor.is_mine:
             self.added_on = self.IS_MY_OPINION
             self.first_descriptor_id = descriptor.id
-            self.labels = descriptor.tags
+            self.labels = set(descriptor.tags)
             return
         # My descriptor beats my reactions, and I don't want
         # to take anyone else's opinion
@@ -165,14 +175,14 @@ class SimpleDescriptorRollup:
         elif descriptor.is_false_positive:
             self.added_on = self.IS_MY_OPINION
             self.first_descriptor_id = descriptor.id
-            self.labels = descriptor.tags
+            self.labels = set(descriptor.tags)
             return
         # Else merge the labels together
         self.added_on, self.first_descriptor_id = min(
             (self.added_on, self.first_descriptor_id),
             (descriptor.added_on, descriptor.id),
         )
-        self.labels.union(descriptor.tags)
+        self.labels.update(descriptor.tags)
 
     def as_row(self) -> t.Tuple[int, str, str]:
         """Simple conversion to CSV row"""
@@ -192,15 +202,19 @@ class SimpleDescriptorRollup:
     ) -> t.Optional["SimpleDescriptorRollup"]:
         if te_json["should_delete"] or not te_json["descriptors"]["data"]:
             return None
-        descriptors = []
+        indicator = te_json["indicator"]
+        indicator_type = te_json["type"]
+        ret = None
         for descriptor_json in te_json["descriptors"]["data"]:
             # Look at me ma! I'm modifying input paramaters!
-            descriptor_json["raw_indicator"] = te_json["indicator"]
-            descriptor_json["type"] = te_json["type"]
-            descriptors.append(
-                ThreatDescriptor.from_te_json(my_app_id, descriptor_json)
-            )
-        return cls.from_descriptors(descriptors)
+            descriptor_json["raw_indicator"] = indicator
+            descriptor_json["type"] = indicator_type
+            descriptor = ThreatDescriptor.from_te_json(my_app_id, descriptor_json)
+            if ret is None:
+                ret = cls.from_descriptor(descriptor)
+            else:
+                ret.merge(descriptor)
+        return ret
 
     @staticmethod
     def te_threat_updates_fields() -> t.Tuple[str, ...]:
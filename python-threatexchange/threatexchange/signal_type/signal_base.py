@@ -6,6 +6,7 @@ Core abstractions for signal types.
 """
 
 import csv
+import functools
 import os
 import pathlib
 import pickle
@@ -32,12 +33,9 @@ class TrivialSignalTypeIndex(index.SignalTypeIndex):
     @classmethod
     def build(cls, vals: t.Iterable[t.Tuple[str, t.Any]]):
         ret = cls()
+        state = ret.state
         for k, val in vals:
-            l = ret.state.get(k)
-            if not l:
-                l = []
-                ret.state[k] = l
-            l.append(val)
+            state.setdefault(k, []).append(val)
         return ret
 
     def serialize(self, fout: t.BinaryIO):
@@ -183,6 +181,22 @@ class FileHasher(HashMatcher, FileMatcher):
         return self.match_hash(file_hash)
 
 
+@functools.lru_cache(maxsize=None)
+def _normalized_indicator_types(
+    signal_type: t.Type["SimpleSignalType"],
+) -> t.FrozenSet[str]:
+    """
+    INDICATOR_TYPE as a frozenset, cached per class.
+
+    indicator_applies is called once per descriptor per signal type, and the
+    class constants never change at runtime, so normalize them only once.
+    """
+    types = signal_type.INDICATOR_TYPE
+    if isinstance(types, str):
+        types = (types,)
+    return frozenset(types)
+
+
 class SimpleSignalType(SignalType, HashMatcher):
     """
     Dead simple implementation for loading/storing a SignalType.
@@ -195,10 +209,7 @@ class SimpleSignalType(SignalType, HashMatcher):
 
     @classmethod
     def indicator_applies(cls, indicator_type: str, tags: t.List[str]) -> bool:
-        types = cls.INDICATOR_TYPE
-        if isinstance(cls.INDICATOR_TYPE, str):
-            types = (cls.INDICATOR_TYPE,)
-        if indicator_type not in types:
+        if indicator_type not in _normalized_indicator_types(cls):
             return False
         if cls.TYPE_TAG is not None:
             return cls.TYPE_TAG in tags
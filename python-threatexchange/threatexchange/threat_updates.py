@@ -5,6 +5,7 @@
 Helpers and wrappers around the /threat_updates endpoint.
 """
 
+import concurrent.futures
 import json
 import os
 import pathlib
@@ -22,6 +23,10 @@ class ThreatUpdateSerialization:
     A wrapper for converting records fetched from /threat_updates
     """
 
+    # Subclasses are created once per update, potentially millions per fetch;
+    # keep the base slotted so they can avoid per-instance __dict__s
+    __slots__ = ()
+
     @property
     def key(self):
         """This should either be the indicator type+string or id"""
@@ -59,8 +64,16 @@ class ThreatUpdateSerialization:
 class ThreatUpdateJSON(ThreatUpdateSerialization):
     """A thin wrapper around the /threat_updates API return"""
 
+    __slots__ = ("raw_json", "_id", "_time")
+
     raw_json: t.Dict[str, t.Any]
 
+    def __post_init__(self) -> None:
+        # int-parsed lazily from raw_json and cached - these accessors get
+        # hit several times per update during a fetch
+        self._id: t.Optional[int] = None
+        self._time: t.Optional[int] = None
+
     @property
     def should_delete(self) -> bool:
         """This record is a tombstone, and we should delete our copy"""
@@ -72,7 +85,9 @@ class ThreatUpdateJSON(ThreatUpdateSerialization):
 
     @property
     def id(self) -> int:
-        return int(self.raw_json["id"])
+        if self._id is None:
+            self._id = int(self.raw_json["id"])
+        return self._id
 
     @property
     def indicator(self) -> str:
@@ -85,7 +100,9 @@ class ThreatUpdateJSON(ThreatUpdateSerialization):
     @property
     def time(self) -> int:
         """The time of the update"""
-        return int(self.raw_json["last_updated"])
+        if self._time is None:
+            self._time = int(self.raw_json["last_updated"])
+        return self._time
 
     @classmethod
     def from_threat_updates_json(cls, app_id, te_json):
@@ -166,7 +183,12 @@ class ThreatUpdatesDelta:
         """
         if self.done:
             return
-        now = time.time()
+        now = 0.0
+        if not self.end:
+            # Only needed if this page completes an open-ended fetch, and has
+            # to be captured before the request so we don't claim coverage of
+            # updates that land while it is in flight
+            now = time.time()
         if not self._cursor:
             self._cursor = api.get_threat_updates(
                 self.privacy_group,
@@ -178,7 +200,8 @@ class ThreatUpdatesDelta:
                 decode_fn=ThreatUpdateJSON,
             )
         for update in self._cursor.next():
-            self.updates.append(ThreatUpdateJSON(update.raw_json))
+            # The cursor already decoded each update for us via decode_fn
+            self.updates.append(update)
             # Is supposed to be strictly increasing
             self.current = max(update.time, self.current)
         if self._cursor.done:
@@ -220,18 +243,38 @@ class ThreatUpdatesDelta:
     ) -> None:
         """
         Fetch from threat_updates to get a more up-to-date copy of the data.
+
+        The next page is prefetched on a background thread while the current
+        one is processed, hiding the HTTP round-trip behind local work.
         """
 
         # TODO actually implement fancy threading logic
         # alternative - instead make the API give hints about where to start
         # fetches, which will mean that fancy threading logic will be simpler
-        while not self.done:
-            for update in self.one_fetch(api):
-                progress_fn(update)
-                if limit is not None:
-                    limit -= 1
-                    if limit <= 0:
-                        return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self.one_fetch, api)
+            while True:
+                page = pending.result() or ()
+                # Snapshot now - once the next fetch is in flight it mutates
+                # self.done concurrently, and re-reading it after processing
+                # the page could skip the page the prefetch just finished
+                done = self.done
+                if not done:
+                    pending = prefetcher.submit(self.one_fetch, api)
+                for update in page:
+                    progress_fn(update)
+                    if limit is not None:
+                        limit -= 1
+                        if limit <= 0:
+                            # cancel() rarely wins against a running fetch,
+                            # so the executor shutdown may wait out one
+                            # in-flight page. That's fine - limit is a soft
+                            # cap, and those updates still land in
+                            # self.updates for apply_updates
+                            pending.cancel()
+                            return
+                if done:
+                    return
 
 
 class ThreatUpdateCheckpoint(t.NamedTuple):
@@ -347,6 +390,9 @@ class ThreatUpdatesStore:
         # It's possible the fetch completed but has no records
         if delta.updates:
             self._apply_updates_impl(delta, post_apply_fn)
+            # Applied - don't keep every update of a potentially huge fetch
+            # alive for the remainder of the sync
+            delta.updates.clear()
         self.checkpoint = self.checkpoint.get_updated(delta)
         self._store_checkpoint(self.checkpoint)
 